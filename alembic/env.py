@@ -1,9 +1,11 @@
 import os
 import sys
+import time
 from pathlib import Path
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
+from sqlalchemy.exc import OperationalError
 
 from alembic import context
 
@@ -20,6 +22,13 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Fail fast instead of queueing every other query behind a blocked ALTER TABLE
+LOCK_TIMEOUT = os.getenv("MIGRATION_LOCK_TIMEOUT", "5s")
+STATEMENT_TIMEOUT = os.getenv("MIGRATION_STATEMENT_TIMEOUT", "10min")
+LOCK_RETRIES = int(os.getenv("MIGRATION_LOCK_RETRIES", "5"))
+
+LOCK_NOT_AVAILABLE = "55P03"
+
 
 def get_url():
     """Get database URL from config.py (supports Secrets Manager)"""
@@ -45,6 +54,12 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _is_lock_timeout(exc: OperationalError) -> bool:
+    """Check whether the error is PostgreSQL lock_not_available (psycopg / psycopg2)"""
+    orig = exc.orig
+    return (getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)) == LOCK_NOT_AVAILABLE
+
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
     configuration = config.get_section(config.config_ini_section) or {}
@@ -55,11 +70,24 @@ def run_migrations_online() -> None:
         poolclass=pool.NullPool,
     )
 
-    with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-
-        with context.begin_transaction():
-            context.run_migrations()
+    # All migrations run in one transaction, so a lock timeout rolls back
+    # everything and the whole run can simply be retried.
+    for attempt in range(1, LOCK_RETRIES + 1):
+        try:
+            with connectable.connect() as connection:
+                context.configure(connection=connection, target_metadata=target_metadata)
+
+                with context.begin_transaction():
+                    if connection.dialect.name == "postgresql":
+                        connection.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'"))
+                        connection.execute(text(f"SET LOCAL statement_timeout = '{STATEMENT_TIMEOUT}'"))
+                    context.run_migrations()
+            return
+        except OperationalError as e:
+            if not _is_lock_timeout(e) or attempt == LOCK_RETRIES:
+                raise
+            print(f"Lock timeout during migration (attempt {attempt}/{LOCK_RETRIES}), retrying")
+            time.sleep(attempt)
 
 
 if context.is_offline_mode():
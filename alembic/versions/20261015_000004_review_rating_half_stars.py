@@ -0,0 +1,37 @@
+"""Store reviews.rating as half-stars (SMALLINT 1~10).
+
+Ratings are 0.5~5.0 in 0.5 steps, so they are stored as rating * 2.
+The application converts back to 0.5~5.0 in models.HalfStarRating.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261015_000004"
+down_revision = "20260210_000003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'reviews', 'rating',
+        type_=sa.SmallInteger(),
+        existing_type=sa.Numeric(),
+        existing_nullable=False,
+        postgresql_using='(rating * 2)::smallint',
+        comment='반 별 개수 1~10 (0.5~5.0점 x 2)'
+    )
+    op.create_check_constraint('ck_reviews_rating_half_stars', 'reviews', 'rating BETWEEN 1 AND 10')
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_reviews_rating_half_stars', 'reviews', type_='check')
+    op.alter_column(
+        'reviews', 'rating',
+        type_=sa.Numeric(),
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using='rating / 2.0',
+        comment=None
+    )
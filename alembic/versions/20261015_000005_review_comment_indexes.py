@@ -0,0 +1,25 @@
+"""Align review/comment indexes with the hot lookup paths.
+
+- reviews: ix_reviews_user_movie duplicates uq_user_movie_review, drop it
+- comments / review_likes: index user_id so ON DELETE CASCADE from users
+  does not scan the whole table (declared in models, never created)
+"""
+from alembic import op
+
+
+revision = "20261015_000005"
+down_revision = "20261015_000004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_reviews_user_movie', 'reviews')
+    op.create_index('ix_comments_user_id', 'comments', ['user_id'])
+    op.create_index('ix_review_likes_user_id', 'review_likes', ['user_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_review_likes_user_id', 'review_likes')
+    op.drop_index('ix_comments_user_id', 'comments')
+    op.create_index('ix_reviews_user_movie', 'reviews', ['user_id', 'movie_id'])
@@ -0,0 +1,27 @@
+"""Keyset index for a user's review history.
+
+- reviews: (user_id, created_at DESC, id DESC) replaces idx_reviews_user_created
+  so /api/users/me/reviews can page with WHERE (created_at, id) < cursor
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261015_000006"
+down_revision = "20261015_000005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_reviews_user_created_id',
+        'reviews',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+    op.drop_index('idx_reviews_user_created', 'reviews')
+
+
+def downgrade() -> None:
+    op.create_index('idx_reviews_user_created', 'reviews', ['user_id', 'created_at'])
+    op.drop_index('idx_reviews_user_created_id', 'reviews')
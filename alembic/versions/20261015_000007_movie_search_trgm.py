@@ -0,0 +1,35 @@
+"""Trigram indexes for movie search.
+
+MovieRepository.search filters with ILIKE '%q%' on movies.title/synopsis
+and movie_tags.tag, which B-tree indexes cannot serve. pg_trgm GIN indexes
+answer the same ILIKE predicates without a sequential scan.
+"""
+from alembic import op
+
+
+revision = "20261015_000007"
+down_revision = "20261015_000006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_movies_title_trgm', 'movies', ['title'],
+        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_movies_synopsis_trgm', 'movies', ['synopsis'],
+        postgresql_using='gin', postgresql_ops={'synopsis': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_movie_tags_tag_trgm', 'movie_tags', ['tag'],
+        postgresql_using='gin', postgresql_ops={'tag': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movie_tags_tag_trgm', 'movie_tags')
+    op.drop_index('ix_movies_synopsis_trgm', 'movies')
+    op.drop_index('ix_movies_title_trgm', 'movies')
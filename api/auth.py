@@ -2,14 +2,14 @@
 Authentication API endpoints (Kakao OAuth)
 """
 import os
-import requests
+import httpx
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db import get_db
-from schemas import UserResponse, MessageResponse
+from db import get_async_db
+from schemas import KakaoLoginResponse, MessageResponse
 from repositories.user import UserRepository
 from models import User
 
@@ -22,9 +22,45 @@ KAKAO_AUTH_URL = "https://kauth.kakao.com/oauth/authorize"
 KAKAO_TOKEN_URL = "https://kauth.kakao.com/oauth/token"
 KAKAO_USER_INFO_URL = "https://kapi.kakao.com/v2/user/me"
 
+# Shared pooled client so Kakao calls reuse keep-alive connections (closed in app lifespan)
+http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=10,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+)
+
+async def _get_kakao_user(access_token: str) -> dict:
+    """Fetch Kakao user info for an access token"""
+    user_response = await http_client.get(
+        KAKAO_USER_INFO_URL,
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+
+    if user_response.status_code != 200:
+        raise HTTPException(status_code=400, detail="Failed to get user info from Kakao")
+
+    return user_response.json()
+
+
+async def _get_or_create_user(db: AsyncSession, user_id: str, nickname: str) -> User:
+    """Get Kakao user, creating it on first login"""
+    user_repo = UserRepository(db)
+    user = await user_repo.get(user_id)
+
+    if not user:
+        # ON CONFLICT DO NOTHING: a concurrent first login may insert the row first
+        user = await user_repo.create_if_absent({
+            "id": user_id,
+            "name": nickname,
+            "avatar_text": "카카오 로그인 사용자"
+        })
+        if user is None:
+            user = await user_repo.get(user_id)
+    return user
+
 
 @router.get("/kakao/login")
-def kakao_login():
+async def kakao_login():
     """Redirect to Kakao OAuth login page"""
     if not KAKAO_CLIENT_ID:
         raise HTTPException(status_code=500, detail="KAKAO_CLIENT_ID is not configured")
@@ -37,15 +73,15 @@ def kakao_login():
     return {"auth_url": kakao_oauth_url}
 
 
-@router.get("/kakao/callback")
-def kakao_callback(
+@router.get("/kakao/callback", response_model=KakaoLoginResponse)
+async def kakao_callback(
     code: str = Query(..., description="Authorization code from Kakao"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Handle Kakao OAuth callback"""
     
     # Exchange code for access token
-    token_response = requests.post(
+    token_response = await http_client.post(
         KAKAO_TOKEN_URL,
         data={
             "grant_type": "authorization_code",
@@ -53,8 +89,7 @@ def kakao_callback(
             "redirect_uri": KAKAO_REDIRECT_URI,
             "code": code
         },
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-        timeout=10
+        headers={"Content-Type": "application/x-www-form-urlencoded"}
     )
     
     if token_response.status_code != 200:
@@ -66,16 +101,7 @@ def kakao_callback(
         raise HTTPException(status_code=400, detail="Failed to get access token from Kakao")
     
     # Get user info from Kakao
-    user_response = requests.get(
-        KAKAO_USER_INFO_URL,
-        headers={"Authorization": f"Bearer {access_token}"},
-        timeout=10
-    )
-    
-    if user_response.status_code != 200:
-        raise HTTPException(status_code=400, detail="Failed to get user info from Kakao")
-    
-    user_data = user_response.json()
+    user_data = await _get_kakao_user(access_token)
     kakao_id = str(user_data.get("id"))
     kakao_account = user_data.get("kakao_account", {})
     profile = kakao_account.get("profile", {})
@@ -85,26 +111,18 @@ def kakao_callback(
     nickname = profile.get("nickname", f"User{kakao_id[:6]}")
     
     # Check if user exists, create if not
-    user_repo = UserRepository(db)
-    user = user_repo.get(user_id)
-    
-    if not user:
-        user = user_repo.create({
-            "id": user_id,
-            "name": nickname,
-            "avatar_text": "카카오 로그인 사용자"
-        })
+    user = await _get_or_create_user(db, user_id, nickname)
     
     # Return user info (in production, you'd return a JWT token here)
-    return {
-        "user_id": user.id,
-        "name": user.name,
-        "avatar_text": user.avatar_text,
-        "access_token": access_token  # For demo purposes
-    }
+    return KakaoLoginResponse(
+        user_id=user.id,
+        name=user.name,
+        avatar_text=user.avatar_text,
+        access_token=access_token  # For demo purposes
+    )
 
 
 @router.post("/logout")
-def logout():
+async def logout():
     """Logout user"""
     return MessageResponse(message="Logged out successfully")
@@ -2,19 +2,23 @@
 Movie API endpoints
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db import get_db
+from db import get_db, get_async_db
 from schemas import (
     MovieResponse, MovieListResponse, MovieCreate, MovieUpdate, MessageResponse,
-    ReviewResponse, ReviewListResponse, ReviewCreate
+    ReviewResponse, ReviewListResponse, ReviewCreate, to_review_response
 )
-from repositories.movie import MovieRepository
+from repositories.movie import MovieRepository, AsyncMovieRepository
 from repositories.review import ReviewRepository
 
 router = APIRouter(prefix="/api/movies", tags=["movies"])
 
+# Catalogue reads change rarely; let browsers/CDN reuse them briefly
+CATALOG_CACHE_CONTROL = "public, max-age=60"
+
 
 @router.get("", response_model=MovieListResponse)
 def get_movies(
@@ -77,7 +81,7 @@ def get_movies(
 
 
 @router.get("/{movie_id}", response_model=MovieResponse)
-def get_movie(movie_id: int, db: Session = Depends(get_db)):
+def get_movie(movie_id: int, response: Response, db: Session = Depends(get_db)):
     """Get movie by ID with genres and tags"""
     repo = MovieRepository(db)
     movie = repo.get_with_details(movie_id)
@@ -85,6 +89,7 @@ def get_movie(movie_id: int, db: Session = Depends(get_db)):
     if not movie:
         raise HTTPException(status_code=404, detail="Movie not found")
     
+    response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
     return MovieResponse(
         id=movie.id,
         title=movie.title,
@@ -99,82 +104,57 @@ def get_movie(movie_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/{movie_id}/reviews", response_model=ReviewListResponse)
-def get_movie_reviews(
+async def get_movie_reviews(
     movie_id: int,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get reviews for a specific movie"""
     # Check if movie exists
-    movie_repo = MovieRepository(db)
-    if not movie_repo.get(movie_id):
+    if not await AsyncMovieRepository(db).exists(movie_id):
         raise HTTPException(status_code=404, detail="Movie not found")
     
     review_repo = ReviewRepository(db)
     skip = (page - 1) * page_size
     
-    reviews = review_repo.get_by_movie(movie_id, skip=skip, limit=page_size)
-    total = review_repo.count(filters={"movie_id": movie_id})
+    rows, total = await review_repo.get_by_movie_with_counts(movie_id, skip=skip, limit=page_size)
     
-    review_responses = []
-    for review in reviews:
-        result = review_repo.get_with_counts(review.id)
-        review_responses.append(
-            ReviewResponse(
-                id=review.id,
-                user_id=review.user_id,
-                movie_id=review.movie_id,
-                rating=review.rating,
-                content=review.content,
-                created_at=review.created_at,
-                likes_count=result["likes_count"],
-                comments_count=result["comments_count"]
-            )
-        )
+    review_responses = [
+        to_review_response(review, likes_count, comments_count)
+        for review, likes_count, comments_count in rows
+    ]
     
     return ReviewListResponse(reviews=review_responses, total=total)
 
 
 @router.post("/{movie_id}/reviews", response_model=ReviewResponse, status_code=201)
-def create_movie_review(
+async def create_movie_review(
     movie_id: int,
     review: ReviewCreate,
     user_id: str = Query(..., description="User ID"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a review for a specific movie"""
     # Check if movie exists
-    movie_repo = MovieRepository(db)
-    if not movie_repo.get(movie_id):
+    if not await AsyncMovieRepository(db).exists(movie_id):
         raise HTTPException(status_code=404, detail="Movie not found")
     
     review_repo = ReviewRepository(db)
     
-    # Check if user already reviewed this movie
-    existing = review_repo.get_user_review_for_movie(user_id, movie_id)
-    if existing:
-        raise HTTPException(
-            status_code=400,
-            detail="User already reviewed this movie. Use PUT to update."
-        )
-    
     review_data = review.model_dump()
     review_data["user_id"] = user_id
     review_data["movie_id"] = movie_id
     
-    db_review = review_repo.create(review_data)
+    # Returns None if the user already reviewed this movie (no check-then-insert race)
+    db_review = await review_repo.create_if_absent(review_data)
+    if not db_review:
+        raise HTTPException(
+            status_code=400,
+            detail="User already reviewed this movie. Use PUT to update."
+        )
     
-    return ReviewResponse(
-        id=db_review.id,
-        user_id=db_review.user_id,
-        movie_id=db_review.movie_id,
-        rating=db_review.rating,
-        content=db_review.content,
-        created_at=db_review.created_at,
-        likes_count=0,
-        comments_count=0
-    )
+    return to_review_response(db_review)
 
 
 @router.post("", response_model=MovieResponse, status_code=201)
@@ -236,12 +216,14 @@ def delete_movie(movie_id: int, db: Session = Depends(get_db)):
 @router.get("/genre/{genre}", response_model=List[MovieResponse])
 def get_movies_by_genre(
     genre: str,
+    response: Response,
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db)
 ):
     """Get movies by genre"""
     repo = MovieRepository(db)
     movies = repo.get_by_genre(genre, limit=limit)
+    response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
     
     return [
         MovieResponse(
@@ -261,12 +243,14 @@ def get_movies_by_genre(
 
 @router.get("/popular/list", response_model=List[MovieResponse])
 def get_popular_movies(
+    response: Response,
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db)
 ):
     """Get popular movies (by review count)"""
     repo = MovieRepository(db)
     movies = repo.get_popular(limit=limit)
+    response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
     
     return [
         MovieResponse(
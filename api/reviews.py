@@ -3,12 +3,13 @@ Review API endpoints
 """
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db import get_db
+from db import get_async_db
 from schemas import (
     ReviewResponse, ReviewListResponse, ReviewCreate, ReviewUpdate,
-    CommentResponse, CommentCreate, MessageResponse
+    CommentResponse, CommentCreate, LikeToggleResponse, MessageResponse,
+    to_review_response
 )
 from repositories.review import ReviewRepository
 
@@ -16,139 +17,111 @@ router = APIRouter(prefix="/api/reviews", tags=["reviews"])
 
 
 @router.get("/{review_id}", response_model=ReviewResponse)
-def get_review(review_id: int, db: Session = Depends(get_db)):
+async def get_review(review_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get review by ID with counts"""
     repo = ReviewRepository(db)
-    result = repo.get_with_counts(review_id)
+    result = await repo.get_with_counts(review_id)
     
     if not result:
         raise HTTPException(status_code=404, detail="Review not found")
     
     review = result["review"]
-    return ReviewResponse(
-        id=review.id,
-        user_id=review.user_id,
-        movie_id=review.movie_id,
-        rating=review.rating,
-        content=review.content,
-        created_at=review.created_at,
-        likes_count=result["likes_count"],
-        comments_count=result["comments_count"]
-    )
+    return to_review_response(review, result["likes_count"], result["comments_count"])
 
 
 @router.post("", response_model=ReviewResponse, status_code=201)
-def create_review(
+async def create_review(
     review: ReviewCreate,
     user_id: str = Query(..., description="User ID"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new review"""
     repo = ReviewRepository(db)
     
-    # Check if user already reviewed this movie
-    existing = repo.get_user_review_for_movie(user_id, review.movie_id)
-    if existing:
+    review_data = review.model_dump()
+    review_data["user_id"] = user_id
+    
+    # Returns None if the user already reviewed this movie (no check-then-insert race)
+    db_review = await repo.create_if_absent(review_data)
+    if not db_review:
         raise HTTPException(
             status_code=400,
             detail="User already reviewed this movie. Use PUT to update."
         )
     
-    review_data = review.model_dump()
-    review_data["user_id"] = user_id
-    
-    db_review = repo.create(review_data)
-    
-    return ReviewResponse(
-        id=db_review.id,
-        user_id=db_review.user_id,
-        movie_id=db_review.movie_id,
-        rating=db_review.rating,
-        content=db_review.content,
-        created_at=db_review.created_at,
-        likes_count=0,
-        comments_count=0
-    )
+    return to_review_response(db_review)
 
 
 @router.put("/{review_id}", response_model=ReviewResponse)
-def update_review(
+async def update_review(
     review_id: int,
     review: ReviewUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a review"""
     repo = ReviewRepository(db)
     
     review_data = review.model_dump(exclude_unset=True)
-    db_review = repo.update(review_id, review_data)
+    db_review = await repo.update(review_id, review_data)
     
     if not db_review:
         raise HTTPException(status_code=404, detail="Review not found")
     
-    result = repo.get_with_counts(review_id)
-    
-    return ReviewResponse(
-        id=db_review.id,
-        user_id=db_review.user_id,
-        movie_id=db_review.movie_id,
-        rating=db_review.rating,
-        content=db_review.content,
-        created_at=db_review.created_at,
-        likes_count=result["likes_count"],
-        comments_count=result["comments_count"]
-    )
+    result = await repo.get_with_counts(review_id)
+    
+    return to_review_response(db_review, result["likes_count"], result["comments_count"])
 
 
 @router.delete("/{review_id}", response_model=MessageResponse)
-def delete_review(review_id: int, db: Session = Depends(get_db)):
+async def delete_review(review_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete a review"""
     repo = ReviewRepository(db)
     
-    if not repo.delete(review_id):
+    if not await repo.delete(review_id):
         raise HTTPException(status_code=404, detail="Review not found")
     
     return MessageResponse(message="Review deleted successfully")
 
 
-@router.post("/{review_id}/likes", response_model=MessageResponse)
-def toggle_like(
+@router.post("/{review_id}/likes", response_model=LikeToggleResponse)
+async def toggle_like(
     review_id: int,
     user_id: str = Query(..., description="User ID"),
     is_like: bool = Query(True, description="True for like, False for dislike"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Toggle like/dislike on a review"""
     repo = ReviewRepository(db)
     
-    # Check if review exists
-    if not repo.get(review_id):
+    likes_count = await repo.toggle_like(review_id, user_id, is_like)
+    if likes_count is None:
         raise HTTPException(status_code=404, detail="Review not found")
     
-    repo.toggle_like(review_id, user_id, is_like)
-    
     action = "liked" if is_like else "disliked"
-    return MessageResponse(message=f"Review {action} successfully")
+    return LikeToggleResponse.model_construct(
+        message=f"Review {action} successfully",
+        likes_count=likes_count
+    )
 
 
 @router.get("/{review_id}/comments", response_model=List[CommentResponse])
-def get_comments(
+async def get_comments(
     review_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get comments for a review"""
     repo = ReviewRepository(db)
     
-    # Check if review exists
-    if not repo.get(review_id):
-        raise HTTPException(status_code=404, detail="Review not found")
+    comments = await repo.get_comments(review_id, skip=skip, limit=limit)
     
-    comments = repo.get_comments(review_id, skip=skip, limit=limit)
+    # Only an empty page needs the extra lookup to tell 404 from "no comments"
+    if not comments and not await repo.get(review_id):
+        raise HTTPException(status_code=404, detail="Review not found")
     
     return [
-        CommentResponse(
+        CommentResponse.model_construct(
             id=comment.id,
             review_id=comment.review_id,
             user_id=comment.user_id,
@@ -160,22 +133,22 @@ def get_comments(
 
 
 @router.post("/{review_id}/comments", response_model=CommentResponse, status_code=201)
-def create_comment(
+async def create_comment(
     review_id: int,
     comment: CommentCreate,
     user_id: str = Query(..., description="User ID"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Add a comment to a review"""
     repo = ReviewRepository(db)
     
     # Check if review exists
-    if not repo.get(review_id):
+    if not await repo.get(review_id):
         raise HTTPException(status_code=404, detail="Review not found")
     
-    db_comment = repo.add_comment(review_id, user_id, comment.content)
+    db_comment = await repo.add_comment(review_id, user_id, comment.content)
     
-    return CommentResponse(
+    return CommentResponse.model_construct(
         id=db_comment.id,
         review_id=db_comment.review_id,
         user_id=db_comment.user_id,
@@ -1,127 +1,142 @@
 """
 User API endpoints
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+import base64
+import binascii
+from datetime import datetime
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db import get_db
+from config import USER_CACHE_TTL
+from db import get_async_db
 from schemas import (
     UserResponse, UserCreate, UserUpdate,
-    ReviewResponse, ReviewListResponse,
+    ReviewListResponse, to_review_response,
     TasteAnalysisResponse, MessageResponse
 )
 from repositories.user import UserRepository
 from repositories.review import ReviewRepository
+from utils import cache
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
 
-@router.get("/me", response_model=UserResponse)
-def get_current_user(
-    user_id: str = Query(..., description="User ID"),
-    db: Session = Depends(get_db)
-):
-    """Get current user info"""
-    repo = UserRepository(db)
-    user = repo.get(user_id)
+def _encode_cursor(created_at: datetime, review_id: int) -> str:
+    """Opaque keyset cursor for the review after (created_at, id)"""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{review_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        ts, review_id = base64.urlsafe_b64decode(cursor).decode().rsplit("|", 1)
+        return datetime.fromisoformat(ts), int(review_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def _get_user_response(user_id: str, db: AsyncSession):
+    """UserResponse for user_id, served from the Redis cache when present"""
+    key = cache.user_key(user_id)
+    cached = await cache.get_json(key)
+    if cached:
+        return Response(content=cached, media_type="application/json")
     
+    user = await UserRepository(db).get(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return UserResponse(
-        id=user.id,
-        name=user.name,
-        avatar_text=user.avatar_text,
-        created_at=user.created_at
-    )
+    user_response = UserResponse.model_validate(user)
+    await cache.set_json(key, user_response.model_dump_json(), USER_CACHE_TTL)
+    return user_response
+
+
+@router.get("/me", response_model=UserResponse)
+async def get_current_user(
+    user_id: str = Query(..., description="User ID"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get current user info"""
+    return await _get_user_response(user_id, db)
 
 
 @router.post("", response_model=UserResponse, status_code=201)
-def create_user(user: UserCreate, db: Session = Depends(get_db)):
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Create a new user"""
     repo = UserRepository(db)
     
-    # Check if user already exists
-    existing = repo.get(user.id)
-    if existing:
+    # ON CONFLICT DO NOTHING returns no row when the user already exists
+    db_user = await repo.create_if_absent(user.model_dump())
+    if db_user is None:
         raise HTTPException(status_code=400, detail="User already exists")
     
-    user_data = user.model_dump()
-    db_user = repo.create(user_data)
-    
-    return UserResponse(
-        id=db_user.id,
-        name=db_user.name,
-        avatar_text=db_user.avatar_text,
-        created_at=db_user.created_at
-    )
+    return UserResponse.model_validate(db_user)
 
 
 @router.put("/me", response_model=UserResponse)
-def update_user(
+async def update_user(
     user: UserUpdate,
     user_id: str = Query(..., description="User ID"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update current user"""
     repo = UserRepository(db)
     
     user_data = user.model_dump(exclude_unset=True)
-    db_user = repo.update(user_id, user_data)
+    db_user = await repo.update(user_id, user_data)
     
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return UserResponse(
-        id=db_user.id,
-        name=db_user.name,
-        avatar_text=db_user.avatar_text,
-        created_at=db_user.created_at
-    )
+    await cache.delete(cache.user_key(user_id))
+    
+    return UserResponse.model_validate(db_user)
 
 
 @router.get("/me/reviews", response_model=ReviewListResponse)
-def get_user_reviews(
+async def get_user_reviews(
     user_id: str = Query(..., description="User ID"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (overrides page)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current user's reviews"""
     repo = ReviewRepository(db)
-    skip = (page - 1) * page_size
     
-    reviews = repo.get_by_user(user_id, skip=skip, limit=page_size)
-    total = repo.count(filters={"user_id": user_id})
+    # One extra row tells whether another page exists
+    if cursor:
+        cursor_ts, cursor_id = _decode_cursor(cursor)
+        rows = await repo.get_by_user_cursor(user_id, cursor_ts, cursor_id, limit=page_size + 1)
+        total = await repo.count(filters={"user_id": user_id})
+    else:
+        skip = (page - 1) * page_size
+        rows, total = await repo.get_by_user_with_counts(user_id, skip=skip, limit=page_size + 1)
     
-    review_responses = []
-    for review in reviews:
-        result = repo.get_with_counts(review.id)
-        review_responses.append(
-            ReviewResponse(
-                id=review.id,
-                user_id=review.user_id,
-                movie_id=review.movie_id,
-                rating=review.rating,
-                content=review.content,
-                created_at=review.created_at,
-                likes_count=result["likes_count"],
-                comments_count=result["comments_count"]
-            )
-        )
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1][0]
+        next_cursor = _encode_cursor(last.created_at, last.id)
+    
+    review_responses = [
+        to_review_response(review, likes_count, comments_count)
+        for review, likes_count, comments_count in rows
+    ]
     
-    return ReviewListResponse(reviews=review_responses, total=total)
+    return ReviewListResponse(reviews=review_responses, total=total, next_cursor=next_cursor)
 
 
 @router.get("/me/taste-analysis", response_model=TasteAnalysisResponse)
-def get_taste_analysis(
+async def get_taste_analysis(
+    request: Request,
+    response: Response,
     user_id: str = Query(..., description="User ID"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get user's taste analysis"""
     repo = UserRepository(db)
-    taste = repo.get_taste_analysis(user_id)
+    taste = await repo.get_taste_analysis(user_id)
     
     if not taste:
         raise HTTPException(
@@ -129,25 +144,16 @@ def get_taste_analysis(
             detail="Taste analysis not found. Please create reviews first."
         )
     
-    return TasteAnalysisResponse(
-        user_id=taste.user_id,
-        summary_text=taste.summary_text,
-        updated_at=taste.updated_at
-    )
+    # Analysis only changes when updated_at moves; let polling clients revalidate
+    etag = f'W/"{taste.user_id}:{taste.updated_at.isoformat()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
+    return TasteAnalysisResponse.model_validate(taste)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user(user_id: str, db: Session = Depends(get_db)):
+async def get_user(user_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get user by ID"""
-    repo = UserRepository(db)
-    user = repo.get(user_id)
-    
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    return UserResponse(
-        id=user.id,
-        name=user.name,
-        avatar_text=user.avatar_text,
-        created_at=user.created_at
-    )
+    return await _get_user_response(user_id, db)
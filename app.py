@@ -1,10 +1,16 @@
 """
 Main FastAPI application
 """
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from api import movies, reviews, users, auth
+from config import CORS_ENABLED, CORS_MAX_AGE
+from db import async_engine
+from utils import cache
 from utils.validator import validate_request
 
 from domain.a1_preference import analyze_preference
@@ -15,21 +21,33 @@ from domain.a5_emotional_search import emotional_search
 from domain.a6_group_simulation import simulate_group
 from domain.a7_taste_map import build_taste_map
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close shared outbound HTTP/Redis clients and the async DB pool on shutdown"""
+    yield
+    await auth.http_client.aclose()
+    await cache.close()
+    await async_engine.dispose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Movie Recommendation API",
     description="정서·서사 기반 영화 취향 시뮬레이션 & 감성 검색 서비스",
-    version="1.0.1"
+    version="1.0.1",
+    lifespan=lifespan
 )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # 프로덕션에서는 특정 도메인으로 제한
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS middleware (CORS_ENABLED=false when the proxy in front handles CORS)
+if CORS_ENABLED:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # 프로덕션에서는 특정 도메인으로 제한
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        max_age=CORS_MAX_AGE,  # Browsers reuse the preflight instead of re-sending OPTIONS
+    )
 
 # Include routers
 app.include_router(movies.router)
@@ -38,20 +56,25 @@ app.include_router(users.router)
 app.include_router(auth.router)
 
 
-@app.get("/")
-def root():
+# Static bodies for the probe endpoints: no per-request validation or encoding
+_ROOT_JSON = orjson.dumps({
+    "status": "ok",
+    "message": "Movie Recommendation API is running",
+    "version": "1.0.0"
+})
+_HEALTH_JSON = orjson.dumps({"status": "healthy"})
+
+
+@app.get("/", include_in_schema=False)
+async def root():
     """Health check endpoint"""
-    return {
-        "status": "ok",
-        "message": "Movie Recommendation API is running",
-        "version": "1.0.0"
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
-@app.get("/health")
-def health_check():
+@app.get("/health", include_in_schema=False)
+async def health_check():
     """Health check for load balancer"""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_JSON, media_type="application/json")
 
 
 @app.post("/analyze/preference")
@@ -1,6 +1,8 @@
 import os
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from config import get_database_url
 
@@ -9,32 +11,48 @@ class Base(DeclarativeBase):
     pass
 
 
-def get_engine():
-    """
-    Create SQLAlchemy engine with RDS connection
-    
-    Returns:
-        Engine: SQLAlchemy engine instance
-    """
-    database_url = get_database_url()
-    
-    url = make_url(database_url)
+def _json_dumps(value) -> str:
+    # Encode JSON/JSONB columns with orjson; non-str keys allowed like json.dumps
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _prepare_threshold():
+    value = os.getenv("DB_PREPARE_THRESHOLD", "5")
+    return None if value.lower() == "none" else int(value)
+
+
+def _database_url():
+    """Database URL pinned to the psycopg 3 driver (sync and async)"""
+    url = make_url(get_database_url())
+    if url.get_backend_name() == "postgresql":
+        # psycopg2 has no asyncio support or auto-prepare; psycopg 3 handles both
+        url = url.set(drivername="postgresql+psycopg")
+    return url
+
+
+def _engine_options(url, pool_size: int, max_overflow: int):
+    """Engine options shared by the sync and async engines (pool budget per engine)"""
     is_postgres = url.get_backend_name().startswith("postgresql")
 
     # Engine configuration
     engine_config = {
         "echo": os.getenv("SQL_ECHO", "false").lower() == "true",
+        "json_serializer": _json_dumps,
+        "json_deserializer": orjson.loads,
     }
 
     if is_postgres:
         engine_config.update(
             {
                 "pool_pre_ping": True,  # Verify connections before using
-                "pool_size": 10,
-                "max_overflow": 20,
-                "pool_recycle": 3600,  # Recycle connections after 1 hour
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),  # Fail fast instead of queueing 30s
+                "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),  # Recycle connections after 30 minutes
                 "connect_args": {
-                    "connect_timeout": 10  # 10 second timeout
+                    "connect_timeout": 10,  # 10 second timeout
+                    # Server-side prepare after N executions; "none" for PgBouncer/RDS Proxy transaction pooling
+                    "prepare_threshold": _prepare_threshold(),
                 },
             }
         )
@@ -53,14 +71,55 @@ def get_engine():
             # Use require mode if cert not found but SSL is desired
             engine_config["connect_args"]["sslmode"] = "require"
     
-    return create_engine(database_url, **engine_config)
+    return engine_config
+
+
+def get_engine():
+    """
+    Create SQLAlchemy engine with RDS connection
+    
+    Returns:
+        Engine: SQLAlchemy engine instance
+    """
+    url = _database_url()
+    # Sync engine only serves the movie endpoints; keep its pool small
+    return create_engine(
+        url,
+        **_engine_options(
+            url,
+            pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "5")),
+        )
+    )
 
 
-# Create engine instance
+def get_async_engine():
+    """
+    Create async SQLAlchemy engine (psycopg 3 driver) with RDS connection
+    
+    Returns:
+        AsyncEngine: SQLAlchemy async engine instance
+    """
+    url = _database_url()
+    # Reviews/users traffic; with the sync pool, at most 30 connections per process by default
+    return create_async_engine(
+        url,
+        **_engine_options(
+            url,
+            pool_size=int(os.getenv("DB_ASYNC_POOL_SIZE", "10")),
+            max_overflow=int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "10")),
+        )
+    )
+
+
+# Create engine instances
 engine = get_engine()
+async_engine = get_async_engine()
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Keep loaded state after commit; sessions are per request, so nothing goes stale
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession)
 
 
 def get_db():
@@ -75,3 +134,14 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Dependency for FastAPI to get async database session
+    
+    Yields:
+        AsyncSession: SQLAlchemy async session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
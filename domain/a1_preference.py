@@ -1,14 +1,73 @@
-from domain.taxonomy import load_taxonomy
+from functools import lru_cache
+from operator import mul
+from typing import Tuple
+
+from domain.taxonomy import taxonomy_key_tuples
+
+
+_HASH_BASE = 131
+_HASH_MOD = 1000003
+_HASH_CHUNK = 4096
+_HASH_LOOP_MAX = 32
+# 131^i mod p (i = 0..CHUNK), 그리고 청크 내 위치별 가중치 [131^(CHUNK-1), ..., 131^0]
+_HASH_POW = [pow(_HASH_BASE, i, _HASH_MOD) for i in range(_HASH_CHUNK + 1)]
+_HASH_WEIGHTS = _HASH_POW[_HASH_CHUNK - 1::-1]
+# 점수 캐시 대상 텍스트 최대 길이(문자 수); 캐시 메모리를 maxsize * 약 2K 문자로 제한
+_SCORE_CACHE_TEXT_MAX = 2048
+
+
+def _roll_hash(data: bytes, h: int = 0) -> int:
+    """
+    h = (h * 131 + b) % 1000003 를 바이트마다 반복한 것과 같은 값.
+    긴 입력은 청크 단위로 h * 131^n + sum(b_i * 131^(n-1-i)) 를 C 레벨 sum/map으로 계산
+    """
+    if len(data) <= _HASH_LOOP_MAX:
+        # 태그처럼 짧은 입력은 단순 루프가 더 빠름
+        for b in data:
+            h = (h * _HASH_BASE + b) % _HASH_MOD
+        return h
+    for start in range(0, len(data), _HASH_CHUNK):
+        chunk = data[start:start + _HASH_CHUNK]
+        n = len(chunk)
+        h = (h * _HASH_POW[n] + sum(map(mul, chunk, _HASH_WEIGHTS[_HASH_CHUNK - n:]))) % _HASH_MOD
+    return h
 
 
 def _stable_score(text: str, tag: str) -> float:
-    seed = (text + "||" + tag).encode("utf-8")
-    h = 0
-    for b in seed:
-        h = (h * 131 + b) % 1000003
+    h = _roll_hash((text + "||" + tag).encode("utf-8"))
     return round((h % 1000) / 1000.0, 3)
 
 
+def _tag_scores(text: str, tags: Tuple[str, ...]) -> Tuple[Tuple[str, float], ...]:
+    prefix = _roll_hash((text + "||").encode("utf-8"))
+    return tuple(
+        (tag, round((_roll_hash(tag.encode("utf-8"), prefix) % 1000) / 1000.0, 3))
+        for tag in tags
+    )
+
+
+@lru_cache(maxsize=1024)
+def _tag_scores_cached(text: str, tags: Tuple[str, ...]) -> Tuple[Tuple[str, float], ...]:
+    return _tag_scores(text, tags)
+
+
+def _score_tags(text: str, tags) -> dict:
+    """
+    {tag: _stable_score(text, tag)} — 공통 접두어(text + "||") 해시는 한 번만 계산
+    짧은 텍스트만 (text, tags) 단위로 캐시 (요청 본문 크기 제한이 없으므로 긴 텍스트는 캐시에 보관하지 않음)
+    """
+    tags = tuple(tags)
+    if len(text) > _SCORE_CACHE_TEXT_MAX:
+        return dict(_tag_scores(text, tags))
+    return dict(_tag_scores_cached(text, tags))
+
+
+@lru_cache(maxsize=1)
+def _preference_tags(e_keys: tuple, n_keys: tuple) -> tuple:
+    # 취향 벡터 전체 태그 + 결말 키 (taxonomy가 같으면 요청마다 같은 튜플 객체)
+    return (*e_keys, *n_keys, "ending_happy", "ending_open", "ending_bittersweet")
+
+
 def analyze_preference(payload: dict) -> dict:
     """
     A-1: 사용자 텍스트 -> 취향 벡터
@@ -19,18 +78,24 @@ def analyze_preference(payload: dict) -> dict:
     if isinstance(dislikes_text, str) and dislikes_text.strip():
         dislike_tags = [t.strip() for t in dislikes_text.split(",") if t.strip()]
 
-    taxonomy = load_taxonomy()
-    e_keys = taxonomy.get("emotion", {}).get("tags", [])
-    n_keys = taxonomy.get("story_flow", {}).get("tags", [])
+    emotion_scores = {}
+    narrative_traits = {}
+    ending_preference = {}
+    # dislike_tags만 필요한 호출은 include_scores=false로 점수 계산(taxonomy/해시)을 건너뜀
+    if payload.get("include_scores", True):
+        e_keys, n_keys, _, _ = taxonomy_key_tuples()
 
-    emotion_scores = {k: _stable_score(text, k) for k in e_keys}
-    narrative_traits = {k: _stable_score(text, k) for k in n_keys}
+        # 사용자 텍스트(접두어)는 감정/서사/결말 태그 전체에 대해 한 번만 인코딩·해시
+        scores = _score_tags(text, _preference_tags(e_keys, n_keys))
 
-    ending_preference = {
-        "happy": _stable_score(text, "ending_happy"),
-        "open": _stable_score(text, "ending_open"),
-        "bittersweet": _stable_score(text, "ending_bittersweet"),
-    }
+        emotion_scores = {k: scores[k] for k in e_keys}
+        narrative_traits = {k: scores[k] for k in n_keys}
+
+        ending_preference = {
+            "happy": scores["ending_happy"],
+            "open": scores["ending_open"],
+            "bittersweet": scores["ending_bittersweet"],
+        }
 
     return {
         "user_text": text,
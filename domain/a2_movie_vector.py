@@ -1,5 +1,9 @@
-from domain.taxonomy import load_taxonomy
-from domain.a1_preference import _stable_score
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+
+from domain.taxonomy import taxonomy_key_tuples
+from domain.a1_preference import _score_tags
 
 
 def _movie_text(movie_payload: dict) -> str:
@@ -15,8 +19,14 @@ def _movie_text(movie_payload: dict) -> str:
     return " ".join(parts)
 
 
+@lru_cache(maxsize=1)
+def _profile_tags(e_keys: tuple, n_keys: tuple, d_keys: tuple, c_keys: tuple) -> tuple:
+    # 프로필 전체 태그 + 결말 키 (taxonomy가 같으면 요청마다 같은 튜플 객체)
+    return (*e_keys, *n_keys, *d_keys, *c_keys, "ending_happy", "ending_open", "ending_bittersweet")
+
+
 def _top_tags(scores: dict, top_n: int = 3) -> list[str]:
-    return [k for k, _ in sorted(scores.items(), key=lambda x: x[1], reverse=True)[:top_n]]
+    return [k for k, _ in nlargest(top_n, scores.items(), key=itemgetter(1))]
 
 
 def process_movie_vector(movie_payload: dict) -> dict:
@@ -27,16 +37,15 @@ def process_movie_vector(movie_payload: dict) -> dict:
     title = movie_payload.get("title", "Dummy Movie")
     text = _movie_text(movie_payload)
 
-    taxonomy = load_taxonomy()
-    e_keys = taxonomy.get("emotion", {}).get("tags", [])
-    n_keys = taxonomy.get("story_flow", {}).get("tags", [])
-    d_keys = taxonomy.get("direction_mood", {}).get("tags", [])
-    c_keys = taxonomy.get("character_relationship", {}).get("tags", [])
+    e_keys, n_keys, d_keys, c_keys = taxonomy_key_tuples()
+
+    # 영화 텍스트(접두어) 해시는 전체 태그에 대해 한 번만 계산
+    scores = _score_tags(text, _profile_tags(e_keys, n_keys, d_keys, c_keys))
 
-    emotion_scores = {k: _stable_score(text, k) for k in e_keys}
-    narrative_traits = {k: _stable_score(text, k) for k in n_keys}
-    direction_mood = {k: _stable_score(text, k) for k in d_keys}
-    character_relationship = {k: _stable_score(text, k) for k in c_keys}
+    emotion_scores = {k: scores[k] for k in e_keys}
+    narrative_traits = {k: scores[k] for k in n_keys}
+    direction_mood = {k: scores[k] for k in d_keys}
+    character_relationship = {k: scores[k] for k in c_keys}
 
     profile = {
         "movie_id": movie_id,
@@ -46,9 +55,9 @@ def process_movie_vector(movie_payload: dict) -> dict:
         "direction_mood": direction_mood,
         "character_relationship": character_relationship,
         "ending_preference": {
-            "happy": _stable_score(text, "ending_happy"),
-            "open": _stable_score(text, "ending_open"),
-            "bittersweet": _stable_score(text, "ending_bittersweet"),
+            "happy": scores["ending_happy"],
+            "open": scores["ending_open"],
+            "bittersweet": scores["ending_bittersweet"],
         },
     }
 
@@ -2,39 +2,41 @@ import math
 from typing import Dict, List
 
 
-def _cosine_sim(a: List[float], b: List[float]) -> float:
-    dot = sum(x * y for x, y in zip(a, b))
-    na = math.sqrt(sum(x * x for x in a))
-    nb = math.sqrt(sum(y * y for y in b))
+def _aligned_cosine(user_vec: Dict[str, float], movie_vec: Dict[str, float]) -> float:
+    """
+    user_vec 키 순서로 정렬한 두 벡터의 코사인 유사도 (정렬 리스트 없이 dot/norm을 한 번에 누적)
+    """
+    dot = na = nb = 0.0
+    for k, x in user_vec.items():
+        x = float(x)
+        y = float(movie_vec.get(k, 0.0))
+        dot += x * y
+        na += x * x
+        nb += y * y
+    na = math.sqrt(na)
+    nb = math.sqrt(nb)
     if na == 0 or nb == 0:
         return 0.0
     return dot / (na * nb)
 
 
-def _align_vector(d: Dict[str, float], keys: List[str]) -> List[float]:
-    return [float(d.get(k, 0.0)) for k in keys]
+_TAG_CATEGORIES = ("emotion_scores", "narrative_traits", "direction_mood", "character_relationship")
 
 
-def _calculate_dislike_penalty(movie_profile: Dict, dislikes: List[str]) -> float:
-    penalty = 0.0
-    categories = ["emotion_scores", "narrative_traits", "direction_mood", "character_relationship"]
-    for category in categories:
+def _movie_tag_index(movie_profile: Dict) -> Dict[str, float]:
+    """
+    영화 프로필의 태그 -> 점수 평면 인덱스 (여러 카테고리에 있는 태그는 합산)
+    """
+    index: Dict[str, float] = {}
+    for category in _TAG_CATEGORIES:
         if category in movie_profile:
-            for tag in dislikes:
-                if tag in movie_profile[category]:
-                    penalty += float(movie_profile[category][tag])
-    return penalty
+            for tag, score in movie_profile[category].items():
+                index[tag] = index.get(tag, 0.0) + float(score)
+    return index
 
 
-def _calculate_boost_score(movie_profile: Dict, boost_tags: List[str]) -> float:
-    boost = 0.0
-    categories = ["emotion_scores", "narrative_traits", "direction_mood", "character_relationship"]
-    for category in categories:
-        if category in movie_profile:
-            for tag in boost_tags:
-                if tag in movie_profile[category]:
-                    boost += float(movie_profile[category][tag])
-    return boost
+def _sum_tag_scores(tag_index: Dict[str, float], tags: List[str]) -> float:
+    return sum((tag_index.get(tag, 0.0) for tag in tags), 0.0)
 
 
 def _top_factors(sim_e: float, sim_n: float, sim_d: float) -> List[str]:
@@ -55,6 +57,7 @@ def calculate_satisfaction_probability(
     weights: Dict[str, float] | None = None,
     penalty_weight: float = 0.7,
     boost_weight: float = 0.5,
+    movie_tag_index: Dict[str, float] | None = None,
 ) -> Dict:
     if dislikes is None:
         dislikes = []
@@ -63,25 +66,21 @@ def calculate_satisfaction_probability(
     if weights is None:
         weights = {"emotion": 0.5, "narrative": 0.3, "ending": 0.2}
 
-    e_keys = list(user_profile.get("emotion_scores", {}).keys())
-    n_keys = list(user_profile.get("narrative_traits", {}).keys())
-    d_keys = list(user_profile.get("ending_preference", {}).keys())
-
-    sim_e = _cosine_sim(
-        _align_vector(user_profile.get("emotion_scores", {}), e_keys),
-        _align_vector(movie_profile.get("emotion_scores", {}), e_keys),
+    sim_e = _aligned_cosine(
+        user_profile.get("emotion_scores", {}), movie_profile.get("emotion_scores", {})
     )
-    sim_n = _cosine_sim(
-        _align_vector(user_profile.get("narrative_traits", {}), n_keys),
-        _align_vector(movie_profile.get("narrative_traits", {}), n_keys),
+    sim_n = _aligned_cosine(
+        user_profile.get("narrative_traits", {}), movie_profile.get("narrative_traits", {})
     )
-    sim_d = _cosine_sim(
-        _align_vector(user_profile.get("ending_preference", {}), d_keys),
-        _align_vector(movie_profile.get("ending_preference", {}), d_keys),
+    sim_d = _aligned_cosine(
+        user_profile.get("ending_preference", {}), movie_profile.get("ending_preference", {})
     )
 
-    boost_score = _calculate_boost_score(movie_profile, boost_tags)
-    dislike_penalty = _calculate_dislike_penalty(movie_profile, dislikes)
+    # 같은 영화를 여러 사용자와 비교할 때(A-6)는 호출부에서 한 번 만든 인덱스를 재사용
+    if movie_tag_index is None:
+        movie_tag_index = _movie_tag_index(movie_profile)
+    boost_score = _sum_tag_scores(movie_tag_index, boost_tags)
+    dislike_penalty = _sum_tag_scores(movie_tag_index, dislikes)
 
     w_e = weights.get("emotion", 0.5)
     w_n = weights.get("narrative", 0.3)
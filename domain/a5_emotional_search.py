@@ -1,4 +1,35 @@
 # 감성 검색 로직
+import re
+
+# taste-simulation-engine의 키워드/태그 확장 매핑
+_KEYWORD_MAP = {
+    "우울": "우울해요",
+    "슬프": "슬퍼요",
+    "긴장": "긴장돼요",
+    "무서": "무서워요",
+    "설레": "설레요",
+    "로맨": "로맨틱해요",
+    "웃기": "웃겨요",
+    "밝": "밝은 분위기예요",
+    "어둡": "어두운 분위기예요",
+    "잔잔": "잔잔해요",
+    "현실": "현실적이에요",
+    "몽환": "몽환적이에요",
+    "감동": "감동적이에요",
+    "힐링": "힐링돼요",
+    "희망": "희망적이에요",
+    "통쾌": "통쾌해요",
+}
+
+# 모든 키워드를 하나의 alternation으로 묶어 텍스트를 한 번만 스캔 (긴 키워드 우선)
+_RE_KEYWORDS = re.compile(
+    "|".join(re.escape(k) for k in sorted(_KEYWORD_MAP, key=len, reverse=True))
+)
+
+# "무겁지 않다"/"가볍다" 류 표현 -> 밝고 잔잔한 분위기로 해석
+_RE_LIGHT_MOOD = re.compile(r"무겁지 않|가볍")
+
+
 def emotional_search(payload: dict) -> dict:
     """
     A-5: 의도 분류 + 쿼리 확장 + 하이브리드 검색 페이로드
@@ -6,39 +37,18 @@ def emotional_search(payload: dict) -> dict:
     """
     text = payload.get("text", "")
 
-    from domain.taxonomy import load_taxonomy
-
-    # taste-simulation-engine의 키워드/태그 확장 매핑
-    keyword_map = {
-        "우울": "우울해요",
-        "슬프": "슬퍼요",
-        "긴장": "긴장돼요",
-        "무서": "무서워요",
-        "설레": "설레요",
-        "로맨": "로맨틱해요",
-        "웃기": "웃겨요",
-        "밝": "밝은 분위기예요",
-        "어둡": "어두운 분위기예요",
-        "잔잔": "잔잔해요",
-        "현실": "현실적이에요",
-        "몽환": "몽환적이에요",
-        "감동": "감동적이에요",
-        "힐링": "힐링돼요",
-        "희망": "희망적이에요",
-        "통쾌": "통쾌해요",
-    }
+    from domain.taxonomy import taxonomy_key_tuples
 
-    taxonomy = load_taxonomy()
-    emotion_tags = taxonomy.get("emotion", {}).get("tags", [])
+    emotion_tags = taxonomy_key_tuples()[0]
     emotion_scores = {tag: 0.0 for tag in emotion_tags}
     if isinstance(text, str):
-        for k, tag in keyword_map.items():
-            if k in text:
-                if tag in emotion_scores:
-                    emotion_scores[tag] = max(emotion_scores.get(tag, 0.0), 0.8)
+        for k in set(_RE_KEYWORDS.findall(text)):
+            tag = _KEYWORD_MAP[k]
+            if tag in emotion_scores:
+                emotion_scores[tag] = max(emotion_scores.get(tag, 0.0), 0.8)
 
     if isinstance(text, str):
-        if "무겁지 않" in text or "가볍" in text:
+        if _RE_LIGHT_MOOD.search(text):
             emotion_scores["밝은 분위기예요"] = max(
                 emotion_scores.get("밝은 분위기예요", 0.0), 0.7
             )
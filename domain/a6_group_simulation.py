@@ -3,7 +3,7 @@ def simulate_group(payload: dict) -> dict:
     """
     A-6: 그룹 사용자 + 영화 프로필로 그룹 만족 확률 계산
     """
-    from domain.a3_prediction import calculate_satisfaction_probability
+    from domain.a3_prediction import calculate_satisfaction_probability, _movie_tag_index
 
     members = payload.get("members", [])
     movie_profile = payload.get("movie_profile", {})
@@ -15,6 +15,8 @@ def simulate_group(payload: dict) -> dict:
 
     user_probs = []
     member_results = []
+    # 영화 쪽 태그 인덱스는 멤버 수와 무관하게 한 번만 생성
+    movie_tag_index = _movie_tag_index(movie_profile)
 
     for m in members:
         profile = m.get("profile", {})
@@ -27,6 +29,7 @@ def simulate_group(payload: dict) -> dict:
             boost_tags=likes,
             penalty_weight=penalty_weight,
             boost_weight=boost_weight,
+            movie_tag_index=movie_tag_index,
         )
         prob = float(result["probability"])
         user_probs.append(prob)
@@ -1,21 +1,26 @@
+from heapq import nlargest
+from operator import itemgetter
+
+
 def build_taste_map(payload: dict) -> dict:
     """
     A-7: 취향 지도 출력 (taste-simulation-engine 형식 맞춤)
     """
-    from domain.taxonomy import load_taxonomy
-    from domain.a1_preference import _stable_score
+    from domain.taxonomy import taxonomy_key_tuples
+    from domain.a1_preference import _score_tags
 
     user_text = payload.get("user_text", "")
     k = int(payload.get("k", 8))
 
-    taxonomy = load_taxonomy()
-    e_keys = taxonomy.get("emotion", {}).get("tags", [])
+    e_keys = taxonomy_key_tuples()[0]
 
-    scores = {k: _stable_score(user_text, k) for k in e_keys}
-    top = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    scores = _score_tags(user_text, e_keys)
+    n_clusters = min(k, 8)
+    # 라벨에는 상위 n_clusters + 1개 태그만 쓰임 (전체 정렬 불필요)
+    top = nlargest(n_clusters + 1, scores.items(), key=itemgetter(1))
 
     clusters = []
-    for i in range(min(k, 8)):
+    for i in range(n_clusters):
         tag_a = top[i % len(top)][0] if top else "Cluster"
         tag_b = top[(i + 1) % len(top)][0] if top else "Cluster"
         clusters.append(
@@ -23,7 +28,7 @@ def build_taste_map(payload: dict) -> dict:
         )
 
     # deterministic 2D location based on text hash
-    seed = sum(bytearray(user_text.encode("utf-8"))) or 1
+    seed = sum(user_text.encode("utf-8")) or 1
     x = round(((seed % 100) / 100.0), 4)
     y = round((((seed // 3) % 100) / 100.0), 4)
     nearest = 0 if clusters else -1
@@ -1,5 +1,8 @@
-import json
+from functools import lru_cache
 from pathlib import Path
+from typing import Tuple
+
+import orjson
 
 
 def _default_taxonomy() -> dict:
@@ -11,11 +14,27 @@ def _default_taxonomy() -> dict:
     }
 
 
+# 파일은 배포 후 바뀌지 않으므로 한 번만 읽음 (호출부는 읽기 전용으로만 사용)
+@lru_cache(maxsize=1)
 def load_taxonomy() -> dict:
     base = Path(__file__).resolve().parents[3]
     path = base / "taste-simulation-engine" / "model_sample" / "emotion_tag.json"
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        # taste-simulation-engine가 함께 배포되지 않은 환경
         return _default_taxonomy()
+    return orjson.loads(data)
+
+
+# 카테고리별 태그를 튜플로 한 번만 추출 — 요청 간 같은 객체를 공유하므로 캐시 키로도 사용 가능
+@lru_cache(maxsize=1)
+def taxonomy_key_tuples() -> Tuple[Tuple[str, ...], ...]:
+    """
+    (emotion, story_flow, direction_mood, character_relationship) 태그 튜플
+    """
+    taxonomy = load_taxonomy()
+    return tuple(
+        tuple(taxonomy.get(category, {}).get("tags", []))
+        for category in ("emotion", "story_flow", "direction_mood", "character_relationship")
+    )
@@ -3,17 +3,35 @@ Database models for Movie Recommendation System
 Based on ERD from 프로젝트 착수 보고서
 """
 from sqlalchemy import (
-    Column, Date, DateTime, Integer, String, Text, Numeric, Float,
-    ForeignKey, UniqueConstraint, Index, Boolean
+    Column, Date, DateTime, Integer, SmallInteger, String, Text, Float,
+    ForeignKey, UniqueConstraint, Index, Boolean, CheckConstraint
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime
+from decimal import Decimal
 
 from db import Base
 
 
+class HalfStarRating(TypeDecorator):
+    """0.5~5.0 별점을 반 별 개수(1~10) SMALLINT로 저장"""
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int(Decimal(str(value)) * 2)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return (Decimal(value) / 2).quantize(Decimal("0.1"))
+
+
 class User(Base):
     """사용자 테이블"""
     __tablename__ = "users"
@@ -49,6 +67,12 @@ class Movie(Base):
     tags = relationship("MovieTag", back_populates="movie", cascade="all, delete-orphan")
     reviews = relationship("Review", back_populates="movie", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # 제목/시놉시스 부분 일치 검색(ILIKE '%q%')용 trigram 인덱스 (pg_trgm)
+        Index('ix_movies_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+        Index('ix_movies_synopsis_trgm', 'synopsis', postgresql_using='gin', postgresql_ops={'synopsis': 'gin_trgm_ops'}),
+    )
+
 
 class MovieGenre(Base):
     """영화 장르 (다대다 분리)"""
@@ -79,6 +103,7 @@ class MovieTag(Base):
 
     __table_args__ = (
         Index('ix_movie_tags_movie_tag', 'movie_id', 'tag'),
+        Index('ix_movie_tags_tag_trgm', 'tag', postgresql_using='gin', postgresql_ops={'tag': 'gin_trgm_ops'}),
     )
 
 
@@ -87,9 +112,9 @@ class Review(Base):
     __tablename__ = "reviews"
 
     id = Column(Integer, primary_key=True)
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), nullable=False, index=True)
-    rating = Column(Numeric(2, 1), nullable=False, comment="0.5~5.0, 0.5 단위")
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), nullable=False)
+    rating = Column(HalfStarRating, nullable=False, comment="반 별 개수 1~10 (0.5~5.0점 x 2)")
     content = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
@@ -101,16 +126,25 @@ class Review(Base):
 
     __table_args__ = (
         UniqueConstraint('user_id', 'movie_id', name='uq_user_movie_review'),
-        Index('ix_reviews_user_movie', 'user_id', 'movie_id'),
+        # 영화별/사용자별 최신순 목록 (movie_id, user_id 단독 조회도 커버)
+        Index('idx_reviews_movie_created', 'movie_id', 'created_at'),
+        # (created_at, id) 키셋 커서 페이지네이션용
+        Index('idx_reviews_user_created_id', 'user_id', created_at.desc(), id.desc()),
+        CheckConstraint('rating BETWEEN 1 AND 10', name='ck_reviews_rating_half_stars'),
     )
 
+    @validates('rating')
+    def _normalize_rating(self, key, value):
+        # commit 후 refresh 없이도 DB에서 읽은 값과 같은 형태(소수 1자리)로 유지
+        return Decimal(str(value)).quantize(Decimal("0.1"))
+
 
 class Comment(Base):
     """리뷰 댓글"""
     __tablename__ = "comments"
 
     id = Column(Integer, primary_key=True)
-    review_id = Column(Integer, ForeignKey("reviews.id", ondelete="CASCADE"), nullable=False, index=True)
+    review_id = Column(Integer, ForeignKey("reviews.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -119,13 +153,17 @@ class Comment(Base):
     review = relationship("Review", back_populates="comments")
     user = relationship("User", back_populates="comments")
 
+    __table_args__ = (
+        Index('idx_comments_review_created', 'review_id', 'created_at'),
+    )
+
 
 class ReviewLike(Base):
     """리뷰 좋아요"""
     __tablename__ = "review_likes"
 
     id = Column(Integer, primary_key=True)
-    review_id = Column(Integer, ForeignKey("reviews.id", ondelete="CASCADE"), nullable=False, index=True)
+    review_id = Column(Integer, ForeignKey("reviews.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     is_like = Column(Boolean, nullable=False, default=True, comment="True=좋아요, False=싫어요")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -3,7 +3,8 @@ Base repository with common CRUD operations
 """
 from typing import Generic, TypeVar, Type, Optional, List, Any, Dict
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, delete
 
 from db import Base
 
@@ -53,7 +54,6 @@ class BaseRepository(Generic[ModelType]):
         db_obj = self.model(**obj_in)
         self.db.add(db_obj)
         self.db.commit()
-        self.db.refresh(db_obj)
         return db_obj
     
     def update(self, id: Any, obj_in: Dict[str, Any]) -> Optional[ModelType]:
@@ -72,10 +72,70 @@ class BaseRepository(Generic[ModelType]):
     
     def delete(self, id: Any) -> bool:
         """Delete a record"""
-        db_obj = self.get(id)
+        # One DELETE; child rows are removed by the FKs' ON DELETE CASCADE
+        result = self.db.execute(delete(self.model).where(self.model.id == id))
+        self.db.commit()
+        return result.rowcount > 0
+
+
+class AsyncBaseRepository(Generic[ModelType]):
+    """Base repository with common CRUD operations (AsyncSession)"""
+    
+    def __init__(self, model: Type[ModelType], db: AsyncSession):
+        self.model = model
+        self.db = db
+    
+    def _apply_filters(self, stmt, filters: Optional[Dict[str, Any]]):
+        if filters:
+            for key, value in filters.items():
+                if hasattr(self.model, key):
+                    stmt = stmt.where(getattr(self.model, key) == value)
+        return stmt
+    
+    async def get(self, id: Any) -> Optional[ModelType]:
+        """Get a single record by ID"""
+        return await self.db.get(self.model, id)
+    
+    async def get_multi(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[ModelType]:
+        """Get multiple records with pagination"""
+        stmt = self._apply_filters(select(self.model), filters)
+        result = await self.db.scalars(stmt.offset(skip).limit(limit))
+        return list(result)
+    
+    async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count records"""
+        stmt = self._apply_filters(select(func.count(self.model.id)), filters)
+        return await self.db.scalar(stmt)
+    
+    async def create(self, obj_in: Dict[str, Any]) -> ModelType:
+        """Create a new record"""
+        db_obj = self.model(**obj_in)
+        self.db.add(db_obj)
+        await self.db.commit()
+        return db_obj
+    
+    async def update(self, id: Any, obj_in: Dict[str, Any]) -> Optional[ModelType]:
+        """Update a record"""
+        db_obj = await self.get(id)
         if not db_obj:
-            return False
+            return None
         
-        self.db.delete(db_obj)
-        self.db.commit()
-        return True
+        for key, value in obj_in.items():
+            if value is not None and hasattr(db_obj, key):
+                setattr(db_obj, key, value)
+        
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
+    
+    async def delete(self, id: Any) -> bool:
+        """Delete a record"""
+        # One DELETE; child rows are removed by the FKs' ON DELETE CASCADE
+        result = await self.db.execute(delete(self.model).where(self.model.id == id))
+        await self.db.commit()
+        return result.rowcount > 0
@@ -2,11 +2,12 @@
 Movie repository with custom queries
 """
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import or_, and_, select, exists
 
 from models import Movie, MovieGenre, MovieTag, Review
-from repositories.base import BaseRepository
+from repositories.base import BaseRepository, AsyncBaseRepository
 
 
 class MovieRepository(BaseRepository[Movie]):
@@ -24,6 +25,20 @@ class MovieRepository(BaseRepository[Movie]):
             .first()
         )
     
+    def update(self, id: Any, obj_in: Dict[str, Any]) -> Optional[Movie]:
+        """Update a movie, returning it with genres and tags already loaded"""
+        db_obj = self.get_with_details(id)
+        if not db_obj:
+            return None
+        
+        for key, value in obj_in.items():
+            if value is not None and hasattr(db_obj, key):
+                setattr(db_obj, key, value)
+        
+        # No server-side defaults change on UPDATE, so no refresh round-trip
+        self.db.commit()
+        return db_obj
+    
     def search(
         self,
         query: Optional[str] = None,
@@ -34,9 +49,10 @@ class MovieRepository(BaseRepository[Movie]):
         limit: int = 20
     ) -> List[Movie]:
         """Search movies by title, genres, category with sorting"""
+        # Collections load in one IN query each, not a genres x tags join under LIMIT
         db_query = self.db.query(Movie).options(
-            joinedload(Movie.genres),
-            joinedload(Movie.tags)
+            selectinload(Movie.genres),
+            selectinload(Movie.tags)
         )
         
         # Text search
@@ -48,17 +64,17 @@ class MovieRepository(BaseRepository[Movie]):
                 )
             )
         
-        # Genre filter
+        # Genre filter (EXISTS, so no row fan-out or DISTINCT)
         if genres:
-            db_query = db_query.join(MovieGenre).filter(
-                MovieGenre.genre.in_(genres)
-            ).distinct()
+            db_query = db_query.filter(
+                Movie.genres.any(MovieGenre.genre.in_(genres))
+            )
         
         # Category filter (can be used for tags or other categorization)
         if category:
-            db_query = db_query.join(MovieTag).filter(
-                MovieTag.tag.ilike(f"%{category}%")
-            ).distinct()
+            db_query = db_query.filter(
+                Movie.tags.any(MovieTag.tag.ilike(f"%{category}%"))
+            )
         
         # Sorting
         if sort == "popular":
@@ -102,15 +118,15 @@ class MovieRepository(BaseRepository[Movie]):
         
         # Genre filter
         if genres:
-            db_query = db_query.join(MovieGenre).filter(
-                MovieGenre.genre.in_(genres)
-            ).distinct()
+            db_query = db_query.filter(
+                Movie.genres.any(MovieGenre.genre.in_(genres))
+            )
         
         # Category filter
         if category:
-            db_query = db_query.join(MovieTag).filter(
-                MovieTag.tag.ilike(f"%{category}%")
-            ).distinct()
+            db_query = db_query.filter(
+                Movie.tags.any(MovieTag.tag.ilike(f"%{category}%"))
+            )
         
         return db_query.count()
     
@@ -120,7 +136,7 @@ class MovieRepository(BaseRepository[Movie]):
             self.db.query(Movie)
             .join(MovieGenre)
             .filter(MovieGenre.genre == genre)
-            .options(joinedload(Movie.genres), joinedload(Movie.tags))
+            .options(selectinload(Movie.genres), selectinload(Movie.tags))
             .limit(limit)
             .all()
         )
@@ -134,7 +150,7 @@ class MovieRepository(BaseRepository[Movie]):
             .outerjoin(Review)
             .group_by(Movie.id)
             .order_by(func.count(Review.id).desc())
-            .options(joinedload(Movie.genres), joinedload(Movie.tags))
+            .options(selectinload(Movie.genres), selectinload(Movie.tags))
             .limit(limit)
             .all()
         )
@@ -152,3 +168,14 @@ class MovieRepository(BaseRepository[Movie]):
         self.db.add(movie_tag)
         self.db.commit()
         return True
+
+
+class AsyncMovieRepository(AsyncBaseRepository[Movie]):
+    """Movie repository for the async (review) endpoints"""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(Movie, db)
+    
+    async def exists(self, movie_id: int) -> bool:
+        """Check that a movie exists without loading the row"""
+        return await self.db.scalar(select(exists().where(Movie.id == movie_id)))
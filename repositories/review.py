@@ -1,66 +1,144 @@
 """
 Review repository with custom queries
 """
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy import select, func, delete, exists, literal, case, tuple_, Row
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from models import Review, ReviewLike, Comment
-from repositories.base import BaseRepository
+from repositories.base import AsyncBaseRepository
 
 
-class ReviewRepository(BaseRepository[Review]):
+class ReviewRepository(AsyncBaseRepository[Review]):
     """Review repository with custom queries"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         super().__init__(Review, db)
     
-    def get_by_movie(self, movie_id: int, skip: int = 0, limit: int = 20) -> List[Review]:
+    async def get_by_movie(self, movie_id: int, skip: int = 0, limit: int = 20) -> List[Review]:
         """Get reviews for a movie"""
-        return (
-            self.db.query(Review)
-            .filter(Review.movie_id == movie_id)
+        result = await self.db.scalars(
+            select(Review)
+            .where(Review.movie_id == movie_id)
             .order_by(Review.created_at.desc())
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(result)
     
-    def get_by_user(self, user_id: str, skip: int = 0, limit: int = 20) -> List[Review]:
+    async def get_by_user(self, user_id: str, skip: int = 0, limit: int = 20) -> List[Review]:
         """Get reviews by a user"""
-        return (
-            self.db.query(Review)
-            .filter(Review.user_id == user_id)
+        result = await self.db.scalars(
+            select(Review)
+            .where(Review.user_id == user_id)
             .order_by(Review.created_at.desc())
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(result)
     
-    def get_user_review_for_movie(self, user_id: str, movie_id: int) -> Optional[Review]:
-        """Get user's review for a specific movie"""
+    def _page_select(self, where, *extra):
+        """SELECT Review, likes_count, comments_count[, *extra] in list order"""
+        likes_count = (
+            select(func.count(ReviewLike.id))
+            .where(ReviewLike.review_id == Review.id, ReviewLike.is_like == True)
+            .correlate(Review)
+            .scalar_subquery()
+        )
+        comments_count = (
+            select(func.count(Comment.id))
+            .where(Comment.review_id == Review.id)
+            .correlate(Review)
+            .scalar_subquery()
+        )
         return (
-            self.db.query(Review)
-            .filter(Review.user_id == user_id, Review.movie_id == movie_id)
-            .first()
+            select(Review, likes_count, comments_count, *extra)
+            .options(raiseload("*"))
+            .where(*where)
+            .order_by(Review.created_at.desc(), Review.id.desc())
+        )
+    
+    async def _page_with_counts(self, where, skip: int, limit: int) -> List[Row]:
+        """(Review, likes_count, comments_count) rows for one page in a single query"""
+        result = await self.db.execute(self._page_select(where).offset(skip).limit(limit))
+        return list(result)
+    
+    async def _page_with_total(self, where, skip: int, limit: int) -> Tuple[List[Row], int]:
+        """One page of (Review, likes_count, comments_count) rows plus the total match count"""
+        total_col = func.count().over().label("total")
+        result = await self.db.execute(self._page_select(where, total_col).offset(skip).limit(limit))
+        rows = list(result)
+        if rows:
+            total = rows[0].total
+        elif skip:
+            # Past the last page there is no row to carry the window count
+            total = await self.db.scalar(select(func.count(Review.id)).where(*where))
+        else:
+            total = 0
+        return [row[:3] for row in rows], total
+    
+    async def get_by_movie_with_counts(
+        self, movie_id: int, skip: int = 0, limit: int = 20
+    ) -> Tuple[List[Row], int]:
+        """Get a page of reviews for a movie with like/comment counts, and the movie's review total"""
+        return await self._page_with_total([Review.movie_id == movie_id], skip, limit)
+    
+    async def get_by_user_with_counts(
+        self, user_id: str, skip: int = 0, limit: int = 20
+    ) -> Tuple[List[Row], int]:
+        """Get a page of reviews by a user with like/comment counts, and the user's review total"""
+        return await self._page_with_total([Review.user_id == user_id], skip, limit)
+    
+    async def get_by_user_cursor(
+        self,
+        user_id: str,
+        cursor_ts: Optional[datetime],
+        cursor_id: Optional[int],
+        limit: int = 20
+    ) -> List[Row]:
+        """Keyset page of a user's reviews (with counts) older than (cursor_ts, cursor_id)"""
+        where = [Review.user_id == user_id]
+        if cursor_ts is not None:
+            where.append(tuple_(Review.created_at, Review.id) < tuple_(cursor_ts, cursor_id))
+        return await self._page_with_counts(where, 0, limit)
+    
+    async def get_user_review_for_movie(self, user_id: str, movie_id: int) -> Optional[Review]:
+        """Get user's review for a specific movie"""
+        return await self.db.scalar(
+            select(Review)
+            .where(Review.user_id == user_id, Review.movie_id == movie_id)
+            .limit(1)
+        )
+    
+    async def create_if_absent(self, obj_in: dict) -> Optional[Review]:
+        """Create review unless the user already reviewed the movie (single round-trip)"""
+        stmt = (
+            pg_insert(Review)
+            .values(**obj_in)
+            .on_conflict_do_nothing(constraint="uq_user_movie_review")
+            .returning(Review)
         )
+        review = (await self.db.scalars(stmt)).first()
+        await self.db.commit()
+        return review
     
-    def get_with_counts(self, review_id: int) -> Optional[dict]:
+    async def get_with_counts(self, review_id: int) -> Optional[dict]:
         """Get review with like and comment counts"""
-        review = self.get(review_id)
+        review = await self.get(review_id)
         if not review:
             return None
         
-        likes_count = (
-            self.db.query(func.count(ReviewLike.id))
-            .filter(ReviewLike.review_id == review_id, ReviewLike.is_like == True)
-            .scalar()
+        likes_count = await self.db.scalar(
+            select(func.count(ReviewLike.id))
+            .where(ReviewLike.review_id == review_id, ReviewLike.is_like == True)
         )
         
-        comments_count = (
-            self.db.query(func.count(Comment.id))
-            .filter(Comment.review_id == review_id)
-            .scalar()
+        comments_count = await self.db.scalar(
+            select(func.count(Comment.id))
+            .where(Comment.review_id == review_id)
         )
         
         return {
@@ -69,44 +147,65 @@ class ReviewRepository(BaseRepository[Review]):
             "comments_count": comments_count
         }
     
-    def toggle_like(self, review_id: int, user_id: str, is_like: bool = True) -> bool:
-        """Toggle like/dislike on a review"""
-        existing_like = (
-            self.db.query(ReviewLike)
-            .filter(ReviewLike.review_id == review_id, ReviewLike.user_id == user_id)
-            .first()
+    async def toggle_like(self, review_id: int, user_id: str, is_like: bool = True) -> Optional[int]:
+        """Toggle like/dislike on a review in one statement; returns the new likes count (None if no review)"""
+        review = select(Review.id).where(Review.id == review_id).cte("review")
+        # Same action again removes the reaction
+        removed = (
+            delete(ReviewLike)
+            .where(
+                ReviewLike.review_id == review_id,
+                ReviewLike.user_id == user_id,
+                ReviewLike.is_like == is_like,
+            )
+            .returning(ReviewLike.id)
+            .cte("removed")
         )
-        
-        if existing_like:
-            if existing_like.is_like == is_like:
-                # Remove like if same action
-                self.db.delete(existing_like)
-            else:
-                # Update to opposite action
-                existing_like.is_like = is_like
-        else:
-            # Create new like
-            new_like = ReviewLike(review_id=review_id, user_id=user_id, is_like=is_like)
-            self.db.add(new_like)
-        
-        self.db.commit()
-        return True
+        # Otherwise insert it, or flip an opposite reaction
+        stmt = pg_insert(ReviewLike).from_select(
+            ["review_id", "user_id", "is_like"],
+            select(review.c.id, literal(user_id), literal(is_like))
+            .where(~exists(select(removed.c.id))),
+        )
+        upserted = (
+            stmt.on_conflict_do_update(
+                constraint="uq_review_user_like",
+                set_={"is_like": stmt.excluded.is_like},
+            )
+            .returning(ReviewLike.id)
+            .cte("upserted")
+        )
+        likes_by_others = (
+            select(func.count(ReviewLike.id))
+            .where(
+                ReviewLike.review_id == review_id,
+                ReviewLike.is_like == True,
+                ReviewLike.user_id != user_id,
+            )
+            .scalar_subquery()
+        )
+        # The CTEs' writes are not visible to this SELECT, so add the caller's new reaction
+        own_like = case((exists(select(upserted.c.id)), 1), else_=0) if is_like else literal(0)
+        likes_count = await self.db.scalar(
+            select(likes_by_others + own_like).select_from(review).add_cte(removed, upserted)
+        )
+        await self.db.commit()
+        return likes_count
     
-    def add_comment(self, review_id: int, user_id: str, content: str) -> Comment:
+    async def add_comment(self, review_id: int, user_id: str, content: str) -> Comment:
         """Add comment to review"""
         comment = Comment(review_id=review_id, user_id=user_id, content=content)
         self.db.add(comment)
-        self.db.commit()
-        self.db.refresh(comment)
+        await self.db.commit()
         return comment
     
-    def get_comments(self, review_id: int, skip: int = 0, limit: int = 50) -> List[Comment]:
+    async def get_comments(self, review_id: int, skip: int = 0, limit: int = 50) -> List[Comment]:
         """Get comments for a review"""
-        return (
-            self.db.query(Comment)
-            .filter(Comment.review_id == review_id)
+        result = await self.db.scalars(
+            select(Comment)
+            .where(Comment.review_id == review_id)
             .order_by(Comment.created_at.asc())
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(result)
@@ -1,41 +1,58 @@
 """
 User repository with custom queries
 """
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import Optional, Dict, Any
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from models import User, TasteAnalysis
-from repositories.base import BaseRepository
+from repositories.base import AsyncBaseRepository
 
 
-class UserRepository(BaseRepository[User]):
+class UserRepository(AsyncBaseRepository[User]):
     """User repository with custom queries"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         super().__init__(User, db)
     
-    def get_by_name(self, name: str) -> Optional[User]:
+    async def create_if_absent(self, obj_in: Dict[str, Any]) -> Optional[User]:
+        """Create a user unless the id is taken (existence check and INSERT in one round-trip)"""
+        stmt = (
+            pg_insert(User)
+            .values(**obj_in)
+            .on_conflict_do_nothing(index_elements=[User.id])
+            .returning(User)
+        )
+        user = (await self.db.scalars(stmt)).first()
+        await self.db.commit()
+        return user
+    
+    async def get_by_name(self, name: str) -> Optional[User]:
         """Get user by name"""
-        return self.db.query(User).filter(User.name == name).first()
+        return await self.db.scalar(select(User).where(User.name == name).limit(1))
     
-    def get_taste_analysis(self, user_id: str) -> Optional[TasteAnalysis]:
+    async def get_taste_analysis(self, user_id: str) -> Optional[TasteAnalysis]:
         """Get user's taste analysis"""
-        return (
-            self.db.query(TasteAnalysis)
-            .filter(TasteAnalysis.user_id == user_id)
-            .first()
+        return await self.db.scalar(
+            select(TasteAnalysis)
+            .where(TasteAnalysis.user_id == user_id)
+            .limit(1)
         )
     
-    def update_taste_analysis(self, user_id: str, summary_text: str) -> TasteAnalysis:
-        """Update or create taste analysis"""
-        taste = self.get_taste_analysis(user_id)
-        
-        if taste:
-            taste.summary_text = summary_text
-        else:
-            taste = TasteAnalysis(user_id=user_id, summary_text=summary_text)
-            self.db.add(taste)
-        
-        self.db.commit()
-        self.db.refresh(taste)
+    async def update_taste_analysis(self, user_id: str, summary_text: str) -> TasteAnalysis:
+        """Update or create taste analysis (single INSERT ... ON CONFLICT DO UPDATE)"""
+        stmt = (
+            pg_insert(TasteAnalysis)
+            .values(user_id=user_id, summary_text=summary_text)
+            .on_conflict_do_update(
+                index_elements=[TasteAnalysis.user_id],
+                # onupdate is not applied to ON CONFLICT, so bump updated_at explicitly
+                set_={"summary_text": summary_text, "updated_at": func.now()},
+            )
+            .returning(TasteAnalysis)
+        )
+        result = await self.db.scalars(stmt, execution_options={"populate_existing": True})
+        taste = result.one()
+        await self.db.commit()
         return taste
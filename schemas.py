@@ -2,10 +2,13 @@
 Pydantic schemas for API request/response validation
 """
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
 from datetime import datetime, date
 from decimal import Decimal
 
+if TYPE_CHECKING:
+    from models import Review
+
 
 # ============================================
 # User Schemas
@@ -32,6 +35,13 @@ class UserResponse(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class KakaoLoginResponse(BaseModel):
+    user_id: str
+    name: str
+    avatar_text: Optional[str] = None
+    access_token: str
+
+
 # ============================================
 # Movie Schemas
 # ============================================
@@ -77,7 +87,7 @@ class MovieListResponse(BaseModel):
 # ============================================
 
 class ReviewBase(BaseModel):
-    rating: Decimal = Field(..., ge=0.5, le=5.0, description="0.5~5.0, 0.5 단위")
+    rating: Decimal = Field(..., ge=0.5, le=5.0, multiple_of=0.5, description="0.5~5.0, 0.5 단위")
     content: Optional[str] = None
 
 
@@ -86,7 +96,7 @@ class ReviewCreate(ReviewBase):
 
 
 class ReviewUpdate(BaseModel):
-    rating: Optional[Decimal] = Field(None, ge=0.5, le=5.0)
+    rating: Optional[Decimal] = Field(None, ge=0.5, le=5.0, multiple_of=0.5)
     content: Optional[str] = None
 
 
@@ -101,9 +111,24 @@ class ReviewResponse(ReviewBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+def to_review_response(review: "Review", likes_count: int = 0, comments_count: int = 0) -> ReviewResponse:
+    """Build ReviewResponse from a loaded Review row (skips re-validating DB values)"""
+    return ReviewResponse.model_construct(
+        id=review.id,
+        user_id=review.user_id,
+        movie_id=review.movie_id,
+        rating=review.rating,
+        content=review.content,
+        created_at=review.created_at,
+        likes_count=likes_count,
+        comments_count=comments_count
+    )
+
+
 class ReviewListResponse(BaseModel):
     reviews: List[ReviewResponse]
     total: int
+    next_cursor: Optional[str] = None
 
 
 # ============================================
@@ -146,6 +171,11 @@ class LikeResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class LikeToggleResponse(BaseModel):
+    message: str
+    likes_count: int
+
+
 # ============================================
 # Taste Analysis Schemas
 # ============================================
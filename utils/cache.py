@@ -0,0 +1,54 @@
+# Redis cache-aside 헬퍼 (REDIS_URL 미설정 또는 Redis 장애 시 캐시 없이 DB로 동작)
+import logging
+from typing import Optional, Union
+
+import redis
+import redis.asyncio as aioredis
+
+from config import REDIS_URL
+
+logger = logging.getLogger(__name__)
+
+_client = (
+    aioredis.Redis.from_url(REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5)
+    if REDIS_URL
+    else None
+)
+
+
+def user_key(user_id: str) -> str:
+    return f"user:{user_id}"
+
+
+async def get_json(key: str) -> Optional[bytes]:
+    """캐시된 JSON 바이트, 없으면 None"""
+    if _client is None:
+        return None
+    try:
+        return await _client.get(key)
+    except redis.RedisError as exc:
+        logger.warning("Redis GET %s failed: %s", key, exc)
+        return None
+
+
+async def set_json(key: str, value: Union[str, bytes], ttl: int) -> None:
+    if _client is None:
+        return
+    try:
+        await _client.set(key, value, ex=ttl)
+    except redis.RedisError as exc:
+        logger.warning("Redis SET %s failed: %s", key, exc)
+
+
+async def delete(key: str) -> None:
+    if _client is None:
+        return
+    try:
+        await _client.delete(key)
+    except redis.RedisError as exc:
+        logger.warning("Redis DEL %s failed: %s", key, exc)
+
+
+async def close() -> None:
+    if _client is not None:
+        await _client.aclose()